@@ -2,14 +2,19 @@
 # vim: set expandtab tabstop=4 shiftwidth=4 :
 """Module to define logic common to all comics."""
 
+import concurrent.futures
 import json
 import time
 import os
+import sys
 from datetime import date
-from urlfunctions import get_filename_from_url, get_file_at_url
+from urlfunctions import get_cached_soup_at_url, get_filename_from_url, get_file_at_url
 import inspect
 import logging
 
+# Comic fields usually having the same value for all comics
+REPEATED_KEYS = ("author",)
+
 
 def get_date_for_comic(comic):
     """Return date object for a given comic."""
@@ -103,12 +108,15 @@ class GenericComic(object):
     def _save_db_in_file(cls, data, filepath):
         """Save the list of comics in the JSON file."""
         cls.log("start")
+        # Content is written in one go rather than in many small chunks
         with open(filepath, "w+") as file:
             try:
-                json.dump(data, file, indent=4, sort_keys=True)
+                file.write(json.dumps(data, indent=4, sort_keys=True))
             except KeyboardInterrupt as e:
                 print("Caught exception %s - will finish saving the DB first" % e)
-                json.dump(data, file, indent=4, sort_keys=True)
+                file.seek(0)
+                file.truncate()
+                file.write(json.dumps(data, indent=4, sort_keys=True))
                 raise
         cls.log("done")
 
@@ -122,6 +130,25 @@ class GenericComic(object):
         )
         return get_file_at_url(url, filename, referer)
 
+    @classmethod
+    def get_files_in_output_dir(cls, urls, prefix=None, referer=None):
+        """Download files from URLs and save them in output folder.
+
+        Files are downloaded concurrently (comics made of many images
+        are retrieved much faster) and paths are returned in order.
+        URLs leading to the same file name (an extension may be added
+        later on) are downloaded sequentially not to write a file from
+        different threads."""
+        names = {get_filename_from_url(url).rsplit(".", 1)[0] for url in urls}
+        if len(urls) <= 1 or len(names) < len(urls):
+            return [cls.get_file_in_output_dir(url, prefix, referer) for url in urls]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            return list(
+                executor.map(
+                    lambda url: cls.get_file_in_output_dir(url, prefix, referer), urls
+                )
+            )
+
     @classmethod
     def check_everything_is_ok(cls):
         """Perform tests on the database to check that everything is ok."""
@@ -174,6 +201,8 @@ class GenericComic(object):
                 file_path = os.path.join(output_dir, file_)
                 if file_path not in imgs_paths and file_path != json:
                     print("Unused image", file_path)
+        # Pages retrieved for this comic are not needed anymore
+        get_cached_soup_at_url.cache_clear()
         cls.log("done")
 
     @classmethod
@@ -236,6 +265,18 @@ class GenericComic(object):
                 assert "day" not in comic
                 assert "month" not in comic
                 assert "year" not in comic
+                for key, value in comic.items():
+                    # Strings from soups keep the whole document alive:
+                    # store plain str instead
+                    if isinstance(value, str):
+                        value = str(value)
+                        if key in REPEATED_KEYS:
+                            value = sys.intern(value)
+                        comic[key] = value
+                    elif isinstance(value, list):
+                        comic[key] = [
+                            str(v) if isinstance(v, str) else v for v in value
+                        ]
                 date_ = comic.pop("date", date.today())
                 comic["day"], comic["month"], comic["year"] = (
                     date_.day,
@@ -244,10 +285,9 @@ class GenericComic(object):
                 )
                 prefix = comic.get("prefix", "")
                 assert "local_img" not in comic
-                comic["local_img"] = [
-                    cls.get_file_in_output_dir(i, prefix, referer=comic["url"])
-                    for i in comic["img"]
-                ]
+                comic["local_img"] = cls.get_files_in_output_dir(
+                    comic["img"], prefix, referer=comic["url"]
+                )
                 assert "comic" not in comic
                 comic["comic"] = cls.long_name
                 assert "new" not in comic
@@ -275,6 +315,8 @@ class GenericComic(object):
                 print(cls.name, ": added", new_len, "comics in", delta, "seconds")
             else:
                 print(cls.name, ": nothing new")
+            # Pages retrieved for this comic are not needed anymore
+            get_cached_soup_at_url.cache_clear()
         cls.log("done")
 
     @classmethod
@@ -303,6 +345,8 @@ class GenericComic(object):
         if change:
             cls._save_db(comics)
             print(cls.name, ": some missing resources have been downloaded")
+        # Pages retrieved for this comic are not needed anymore
+        get_cached_soup_at_url.cache_clear()
         cls.log("done")
 
     @classmethod
@@ -3,10 +3,13 @@
 """Module to retrieve webcomics and create ebooks"""
 
 import book
+import urlfunctions
 import argparse
+import concurrent.futures
+import itertools
 import logging
 import random
-from comics import COMICS_DICT
+from comics import COMICS_DICT, GenericEmptyComic
 
 
 def get_file_content_until_tag(path, tag):
@@ -29,6 +32,40 @@ def add_new_lines_after_tag(path, new_lines, tag):
         f.write("".join(content + new_lines))
 
 
+def non_negative_int(string):
+    """Argument type for integers greater than or equal to 0."""
+    value = int(string)
+    if value < 0:
+        raise argparse.ArgumentTypeError("%d is negative" % value)
+    return value
+
+
+# Whether set_up_process has been called in the current process (forked
+# worker processes inherit the value from the main process)
+PROCESS_IS_SET_UP = False
+
+
+def set_up_process(loglevel, http_cache, urls):
+    """Set up the current process (log level, HTTP cache, hosts) once.
+    Worker processes which are not forked do not inherit the setup of the
+    main process: they perform it when handling their first comic."""
+    global PROCESS_IS_SET_UP
+    if not PROCESS_IS_SET_UP:
+        PROCESS_IS_SET_UP = True
+        logging.getLogger().setLevel(loglevel)
+        if http_cache:
+            urlfunctions.enable_http_cache(http_cache)
+        urlfunctions.resolve_hosts(urls)
+
+
+def call_comic_method(comic_class, method_name, setup_args=None):
+    """Call method from comic class, setting the process up first if needed.
+    This is defined at module level to be usable from worker processes."""
+    if setup_args is not None:
+        set_up_process(*setup_args)
+    return getattr(comic_class, method_name)()
+
+
 def main():
     """Main function"""
     logger = logging.getLogger()
@@ -90,6 +127,20 @@ def main():
         action="store_true",
         help=("process comics in random order"),
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=non_negative_int,
+        action="store",
+        help=("number of comics processed in parallel (0 for one per CPU)"),
+        default=1,
+    )
+    parser.add_argument(
+        "--http-cache",
+        action="store",
+        help=("folder used to cache pages between runs (default: no cache)"),
+        default=None,
+    )
     args = parser.parse_args()
     logger.setLevel(args.loglevel)
     # Apply default value
@@ -110,13 +161,38 @@ def main():
     else:
         comic_classes.sort(key=lambda c: c.name.lower(), reverse=args.reverse)
     logging.debug("Starting")
+    urls_to_resolve = []
+    if any(action in ("update", "fix") for action in args.action):
+        # Look for all hosts at once instead of one after the other - empty
+        # (deleted, not working, etc) comics do not retrieve anything
+        urls_to_resolve = [
+            com.url for com in comic_classes if not issubclass(com, GenericEmptyComic)
+        ]
+    setup_args = (args.loglevel, args.http_cache, urls_to_resolve)
+    set_up_process(*setup_args)
     for action in args.action:
         method_name = arg_to_method.get(action)
         if method_name is not None:
-            for com in comic_classes:
-                if args.random:
-                    print(com.name)
-                getattr(com, method_name)()
+            if args.jobs != 1:
+                # Comics are independent: handle them in different processes
+                with concurrent.futures.ProcessPoolExecutor(
+                    max_workers=args.jobs or None
+                ) as executor:
+                    results = executor.map(
+                        call_comic_method,
+                        comic_classes,
+                        itertools.repeat(method_name),
+                        itertools.repeat(setup_args),
+                    )
+                    # Results come in the order of comic_classes
+                    for com, _ in zip(comic_classes, results):
+                        if args.random:
+                            print(com.name)
+            else:
+                for com in comic_classes:
+                    if args.random:
+                        print(com.name)
+                    call_comic_method(com, method_name)
         elif action == "book":
             book.make_book(comic_classes)
         elif action == "gitignore":
@@ -3,15 +3,21 @@
 """Module to retrieve webcomics"""
 
 from comic_abstract import GenericComic, get_date_for_comic
+import collections
+import concurrent.futures
+import functools
 import re
 from datetime import date, timedelta
 import datetime
 from urlfunctions import (
     get_soup_at_url,
+    get_xml_soup_at_url,
+    get_headers_at_url,
     urljoin_wrapper,
     convert_iri_to_plain_ascii_uri,
     load_json_at_url,
     urlopen_wrapper,
+    SoupStrainer,
 )
 import json
 import locale
@@ -38,6 +44,8 @@ class GenericNumberedComic(GenericComic):
     """
 
     _categories = ("NUMBERED",)
+    # Number of comics retrieved ahead of the one being handled
+    nb_prefetched_comics = 4
 
     @classmethod
     def get_next_comic(cls, last_comic):
@@ -46,12 +54,28 @@ class GenericNumberedComic(GenericComic):
         if last_comic:
             first_num = last_comic["num"] + 1
         cls.log("first_num:%d, last_num:%d" % (first_num, last_num))
-        for num in range(first_num, last_num + 1):
-            comic = cls.get_comic_info(num)
-            if comic is not None:
-                assert "num" not in comic
-                comic["num"] = num
-                yield comic
+        # Comics only depend on their number: the next few ones are
+        # retrieved in the background while the oldest one is handled
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=cls.nb_prefetched_comics
+        ) as executor:
+            pending = collections.deque()
+            for num in range(first_num, last_num + 1):
+                pending.append((num, executor.submit(cls.get_comic_info, num)))
+                if len(pending) > cls.nb_prefetched_comics:
+                    yield from cls._get_comics_from_pending(pending)
+            while pending:
+                yield from cls._get_comics_from_pending(pending)
+
+    @classmethod
+    def _get_comics_from_pending(cls, pending):
+        """Handle the oldest comic retrieved (or being retrieved) in the background."""
+        num, future = pending.popleft()
+        comic = future.result()
+        if comic is not None:
+            assert "num" not in comic
+            comic["num"] = num
+            yield comic
 
     @classmethod
     def get_first_and_last_numbers(cls):
@@ -188,20 +212,33 @@ class GenericNavigableComic(GenericComic):
         cls.log("next/first comic will be %s (url is %s)" % (str(next_comic), url))
         if PERFORM_CHECK:
             cls.check_navigation(url)
-        while next_comic:
-            prev_url, url = url, cls.get_url_from_link(next_comic)
-            if prev_url == url:
-                cls.log("got same url %s" % url)
-                break
-            cls.log("about to get %s (%s)" % (url, str(next_comic)))
-            soup = get_soup_at_url(url)
-            comic = cls.get_comic_info(soup, next_comic)
-            if comic is not None:
-                assert "url" not in comic
-                comic["url"] = url
-                yield comic
-            next_comic = cls.get_next_link(soup)
-            cls.log("next comic will be %s" % str(next_comic))
+        # Next page is retrieved in the background while the current comic
+        # is handled (information extraction, images retrieval, etc)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            prefetched = None
+            while next_comic:
+                prev_url, url = url, cls.get_url_from_link(next_comic)
+                if prev_url == url:
+                    cls.log("got same url %s" % url)
+                    break
+                cls.log("about to get %s (%s)" % (url, str(next_comic)))
+                if prefetched is not None and prefetched[0] == url:
+                    soup = prefetched[1].result()
+                else:
+                    soup = get_soup_at_url(url)
+                link, next_comic = next_comic, cls.get_next_link(soup)
+                cls.log("next comic will be %s" % str(next_comic))
+                prefetched = None
+                if next_comic:
+                    next_url = cls.get_url_from_link(next_comic)
+                    if next_url != url:
+                        future = executor.submit(get_soup_at_url, next_url)
+                        prefetched = (next_url, future)
+                comic = cls.get_comic_info(soup, link)
+                if comic is not None:
+                    assert "url" not in comic
+                    comic["url"] = url
+                    yield comic
 
     @classmethod
     def check_first_link(cls):
@@ -292,6 +329,8 @@ class GenericListableComic(GenericComic):
     """
 
     _categories = ("LISTABLE",)
+    # Number of archive pages retrieved ahead of the one being handled
+    nb_prefetched_pages = 4
 
     @classmethod
     def get_archive_elements(cls):
@@ -308,28 +347,47 @@ class GenericListableComic(GenericComic):
         """Get information about a particular comics."""
         raise NotImplementedError
 
+    @classmethod
+    def _get_comics_from_pending(cls, pending):
+        """Handle the oldest page retrieved (or being retrieved) in the background."""
+        url, archive_elt, future = pending.popleft()
+        comic = cls.get_comic_info(future.result(), archive_elt)
+        if comic is not None:
+            assert "url" not in comic
+            comic["url"] = url
+            yield comic
+
     @classmethod
     def get_next_comic(cls, last_comic):
         """Generic implementation of get_next_comic for listable comics."""
         waiting_for_url = last_comic["url"] if last_comic else None
-        archive_elts = list(cls.get_archive_elements())
-        for archive_elt in archive_elts:
-            url = cls.get_url_from_archive_element(archive_elt)
-            cls.log("considering %s" % url)
-            if waiting_for_url is None:
-                cls.log("about to get %s (%s)" % (url, str(archive_elt)))
-                soup = get_soup_at_url(url)
-                comic = cls.get_comic_info(soup, archive_elt)
-                if comic is not None:
-                    assert "url" not in comic
-                    comic["url"] = url
-                    yield comic
-            elif waiting_for_url == url:
-                waiting_for_url = None
+        # Archive elements are consumed as they come: no need for a copy
+        nb_archive_elts = 0
+        # URLs are all known up-front: a few pages are retrieved in the
+        # background while the oldest one is being handled
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=cls.nb_prefetched_pages
+        ) as executor:
+            pending = collections.deque()
+            for nb_archive_elts, archive_elt in enumerate(
+                cls.get_archive_elements(), 1
+            ):
+                url = cls.get_url_from_archive_element(archive_elt)
+                cls.log("considering %s" % url)
+                if waiting_for_url is None:
+                    cls.log("about to get %s (%s)" % (url, str(archive_elt)))
+                    future = executor.submit(get_soup_at_url, url)
+                    pending.append((url, archive_elt, future))
+                    if len(pending) > cls.nb_prefetched_pages:
+                        yield from cls._get_comics_from_pending(pending)
+                elif waiting_for_url == url:
+                    waiting_for_url = None
+            while pending:
+                yield from cls._get_comics_from_pending(pending)
         if waiting_for_url is not None:
             print(
                 "Did not find previous comic %s in the %d comics found: there might be a problem"
-                % (waiting_for_url, len(archive_elts))
+                % (waiting_for_url, nb_archive_elts)
             )
 
 
@@ -457,13 +515,15 @@ def get_a_comicnavbase_comicnavnext(cls, last_soup, next_):
 def get_a_navi_navifirst(cls):
     """Implementation of get_first_comic_link."""
     # ComicPress (WordPress plugin)
-    return get_soup_at_url(cls.url).find("a", class_="navi navi-first")
+    strainer = SoupStrainer("a", class_="navi navi-first")
+    return get_soup_at_url(cls.url, parse_only=strainer).find("a")
 
 
 @classmethod
 def get_a_first(cls):
     """Implementation of get_first_comic_link."""
-    return get_soup_at_url(cls.url).find("a", title="First")
+    strainer = SoupStrainer("a", title="First")
+    return get_soup_at_url(cls.url, parse_only=strainer).find("a")
 
 
 @classmethod
@@ -476,7 +536,19 @@ def get_div_navfirst_a(cls):
 @classmethod
 def get_a_comicnavbase_comicnavfirst(cls):
     """Implementation of get_first_comic_link."""
-    return get_soup_at_url(cls.url).find("a", class_="comic-nav-base comic-nav-first")
+    strainer = SoupStrainer("a", class_="comic-nav-base comic-nav-first")
+    return get_soup_at_url(cls.url, parse_only=strainer).find("a")
+
+
+@classmethod
+def get_a_webcomic_first(cls):
+    """Implementation of get_first_comic_link."""
+    # Webcomic (WordPress plugin)
+    strainer = SoupStrainer(
+        "a",
+        class_="webcomic-link webcomic1-link first-webcomic-link first-webcomic1-link",
+    )
+    return get_soup_at_url(cls.url, parse_only=strainer).find("a")
 
 
 @classmethod
@@ -860,6 +932,9 @@ class SpaceAvalanche(GenericNavigableComic):
     long_name = "Space Avalanche"
     url = "http://www.spaceavalanche.com"
     get_navi_link = get_link_rel_next
+    url_date_re = re.compile(
+        ".*/(?P<year>[0-9]*)/(?P<month>[0-9]*)/(?P<day>[0-9]*)/.*$"
+    )
 
     @classmethod
     def get_first_comic_link(cls):
@@ -878,15 +953,12 @@ class SpaceAvalanche(GenericNavigableComic):
     @classmethod
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
-        url_date_re = re.compile(
-            ".*/(?P<year>[0-9]*)/(?P<month>[0-9]*)/(?P<day>[0-9]*)/.*$"
-        )
         title = link["title"]
         url = cls.get_url_from_link(link)
         imgs = soup.find("div", class_="entry").find_all("img")
         return {
             "title": title,
-            "date": regexp_match_to_date(url_date_re.match(url)),
+            "date": regexp_match_to_date(cls.url_date_re.match(url)),
             "img": [i["src"] for i in imgs],
         }
 
@@ -1044,6 +1116,7 @@ class NeDroid(GenericNavigableComic):
     name = "nedroid"
     long_name = "NeDroid"
     url = "http://nedroid.com"
+    short_url_re = re.compile("^%s/\\?p=([0-9]*)" % url)
     get_first_comic_link = get_div_navfirst_a
     get_navi_link = get_link_rel_next
     get_url_from_link = join_cls_url_to_href
@@ -1051,9 +1124,8 @@ class NeDroid(GenericNavigableComic):
     @classmethod
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
-        short_url_re = re.compile("^%s/\\?p=([0-9]*)" % cls.url)
         short_url = cls.get_url_from_link(soup.find("link", rel="shortlink"))
-        num = int(short_url_re.match(short_url).group(1))
+        num = int(cls.short_url_re.match(short_url).group(1))
         div_comic = soup.find("div", id="comic")
         if div_comic is None:
             imgs = []
@@ -1080,6 +1152,9 @@ class Garfield(GenericComicNotWorking, GenericNavigableComic):  # See issue #50
     long_name = "Garfield"
     url = "https://garfield.com"
     _categories = ("GARFIELD",)
+    url_date_re = re.compile(
+        "^%s/comic/(?P<year>[0-9]*)/(?P<month>[0-9]*)/(?P<day>[0-9]*)" % url
+    )
     get_first_comic_link = simulate_first_link
     first_url = "https://garfield.com/comic/1978/06/19"
 
@@ -1094,14 +1169,11 @@ class Garfield(GenericComicNotWorking, GenericNavigableComic):  # See issue #50
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
         url = cls.get_url_from_link(link)
-        url_date_re = re.compile(
-            "^%s/comic/(?P<year>[0-9]*)/(?P<month>[0-9]*)/(?P<day>[0-9]*)" % cls.url
-        )
         imgs = soup.find("div", class_="comic-display").find_all(
             "img", class_="img-responsive"
         )
         return {
-            "date": regexp_match_to_date(url_date_re.match(url)),
+            "date": regexp_match_to_date(cls.url_date_re.match(url)),
             "img": [i["src"] for i in imgs],
         }
 
@@ -1253,9 +1325,7 @@ class ImogenQuest(GenericNavigableComic):
     @classmethod
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
-        title = soup.find("h2", class_="post-title").string
-        author = soup.find("span", class_="post-author").find("a").string
-        date_str = soup.find("span", class_="post-date").string
+        title, author, date_str = get_post_title_author_date(soup)
         imgs = soup.find("div", class_="comicpane").find_all("img")
         assert all(i["alt"] == i["title"] for i in imgs)
         title2 = imgs[0]["title"]
@@ -1380,6 +1450,7 @@ class BerkeleyMews(GenericListableComic):
     _categories = ("BERKELEY",)
     get_url_from_archive_element = get_href
     comic_num_re = re.compile("%s/\\?p=([0-9]*)$" % url)
+    url_date_re = re.compile(".*/(?P<year>[0-9]*)-(?P<month>[0-9]*)-(?P<day>[0-9]*)-.*")
 
     @classmethod
     def get_archive_elements(cls):
@@ -1391,9 +1462,6 @@ class BerkeleyMews(GenericListableComic):
     @classmethod
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
-        url_date_re = re.compile(
-            ".*/(?P<year>[0-9]*)-(?P<month>[0-9]*)-(?P<day>[0-9]*)-.*"
-        )
         url = cls.get_url_from_archive_element(link)
         num = int(cls.comic_num_re.match(url).group(1))
         img = soup.find("div", id="comic").find("img")
@@ -1405,7 +1473,7 @@ class BerkeleyMews(GenericListableComic):
             "title": link.string,
             "title2": title2,
             "img": [img_url],
-            "date": regexp_match_to_date(url_date_re.match(img_url)),
+            "date": regexp_match_to_date(cls.url_date_re.match(img_url)),
         }
 
 
@@ -1415,6 +1483,10 @@ class GenericBouletCorp(GenericNavigableComic):
     # Also on https://bouletcorp.tumblr.com
     _categories = ("BOULET",)
     get_navi_link = get_link_rel_next
+    # Matches the urls from any of the BouletCorp websites
+    url_date_re = re.compile(
+        "^[^:/]*://[^/]*/(?P<year>[0-9]*)/(?P<month>[0-9]*)/(?P<day>[0-9]*)/"
+    )
 
     @classmethod
     def get_first_comic_link(cls):
@@ -1425,9 +1497,6 @@ class GenericBouletCorp(GenericNavigableComic):
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
         url = cls.get_url_from_link(link)
-        url_date_re = re.compile(
-            "^%s/(?P<year>[0-9]*)/(?P<month>[0-9]*)/(?P<day>[0-9]*)/" % cls.url
-        )
         imgs = (
             soup.find("div", id="notes")
             .find("div", class_="storycontent")
@@ -1443,7 +1512,7 @@ class GenericBouletCorp(GenericNavigableComic):
             ],
             "title": title,
             "texts": texts,
-            "date": regexp_match_to_date(url_date_re.match(url)),
+            "date": regexp_match_to_date(cls.url_date_re.match(url)),
         }
 
 
@@ -1602,13 +1671,16 @@ class MrLovenstein(GenericNumberedComic):
     name = "mrlovenstein"
     long_name = "Mr. Lovenstein"
     url = "http://www.mrlovenstein.com"
+    img_src_re = re.compile("^/images/comics/")
+    comic_num_re = re.compile("^/comic/([0-9]*)$")
 
     @classmethod
     def get_comic_info(cls, num):
         # TODO: more info from http://www.mrlovenstein.com/archive
         url = urljoin_wrapper(cls.url, "/comic/%d" % num)
         soup = get_soup_at_url(url)
-        imgs = list(reversed(soup.find_all("img", src=re.compile("^/images/comics/"))))
+        imgs = soup.find_all("img", src=cls.img_src_re)
+        imgs.reverse()
         description = soup.find("meta", attrs={"name": "description"})["content"]
         return {
             "url": url,
@@ -1620,10 +1692,9 @@ class MrLovenstein(GenericNumberedComic):
     @classmethod
     def get_first_and_last_numbers(cls):
         """Get index of first and last available comics (as a tuple of int)."""
-        comic_num_re = re.compile("^/comic/([0-9]*)$")
         nums = [
-            int(comic_num_re.match(link["href"]).group(1))
-            for link in get_soup_at_url(cls.url).find_all("a", href=comic_num_re)
+            int(cls.comic_num_re.match(link["href"]).group(1))
+            for link in get_soup_at_url(cls.url).find_all("a", href=cls.comic_num_re)
         ]
         return min(nums), max(nums)
 
@@ -1719,7 +1790,8 @@ class AbstruseGoose(GenericListableComic):
     @classmethod
     def get_archive_elements(cls):
         archive_url = urljoin_wrapper(cls.url, "archive")
-        return get_soup_at_url(archive_url).find_all("a", href=cls.comic_url_re)
+        strainer = SoupStrainer("a", href=cls.comic_url_re)
+        return get_soup_at_url(archive_url, parse_only=strainer).find_all("a")
 
     @classmethod
     def get_comic_info(cls, soup, archive_elt):
@@ -1741,25 +1813,24 @@ class PhDComics(GenericNavigableComic):
     url = "http://phdcomics.com/comics/archive.php"
     get_first_comic_link = simulate_first_link
     first_url = "http://phdcomics.com/comics/archive.php?comicid=1"
+    next_button_url = "http://phdcomics.com/comics/images/next_button.gif"
+    prev_button_url = "http://phdcomics.com/comics/images/prev_button.gif"
 
     @classmethod
     def get_navi_link(cls, last_soup, next_):
         """Get link to next or previous comic."""
         # Prev does not work ?
-        url = "http://phdcomics.com/comics/images/%s_button.gif" % (
-            "next" if next_ else "prev"
-        )
+        url = cls.next_button_url if next_ else cls.prev_button_url
         img = last_soup.find("img", src=url)
         return None if img is None else img.parent
 
     @classmethod
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
-        title = soup.find("meta", attrs={"name": "twitter:title"})["content"]
-        imgs = soup.find_all("meta", property="og:image")
+        metas = get_meta_contents(soup)
         return {
-            "img": [i["content"] for i in imgs],
-            "title": title,
+            "img": metas.get(("property", "og:image"), []),
+            "title": metas["name", "twitter:title"][0],
         }
 
 
@@ -1803,11 +1874,14 @@ class OverCompensating(GenericComicNotWorking, GenericNavigableComic):  # Now WI
     long_name = "Over Compensating"
     url = "http://www.overcompensating.com"
     get_url_from_link = join_cls_url_to_href
+    img_src_re = re.compile("^/oc/comics/.*")
+    comic_num_re = re.compile(".*comic=([0-9]*)$")
 
     @classmethod
     def get_first_comic_link(cls):
         """Get link to first comics."""
-        return get_soup_at_url(cls.url).find("a", href=re.compile("comic=1$"))
+        strainer = SoupStrainer("a", href=re.compile("comic=1$"))
+        return get_soup_at_url(cls.url, parse_only=strainer).find("a")
 
     @classmethod
     def get_navi_link(cls, last_soup, next_):
@@ -1817,11 +1891,9 @@ class OverCompensating(GenericComicNotWorking, GenericNavigableComic):  # Now WI
     @classmethod
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
-        img_src_re = re.compile("^/oc/comics/.*")
-        comic_num_re = re.compile(".*comic=([0-9]*)$")
         comic_url = cls.get_url_from_link(link)
-        num = int(comic_num_re.match(comic_url).group(1))
-        img = soup.find("img", src=img_src_re)
+        num = int(cls.comic_num_re.match(comic_url).group(1))
+        img = soup.find("img", src=cls.img_src_re)
         return {
             "num": num,
             "img": [urljoin_wrapper(comic_url, img["src"])],
@@ -1875,8 +1947,9 @@ class ScandinaviaAndTheWorld(GenericNavigableComic):
     @classmethod
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
-        title = soup.find("meta", attrs={"name": "twitter:label1"})["content"]
-        desc = soup.find("meta", property="og:description")["content"]
+        metas = get_meta_contents(soup)
+        title = metas["name", "twitter:label1"][0]
+        desc = metas["property", "og:description"][0]
         imgs = soup.find_all("img", itemprop="image")
         return {
             "title": title,
@@ -1912,15 +1985,13 @@ class MonkeyUser(GenericNavigableComic):
     @classmethod
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
-        title = soup.find("meta", property="og:title")["content"]
-        desc = soup.find("meta", property="og:description")["content"]
-        imgs = soup.find_all("meta", property="og:image")
+        metas = get_meta_contents(soup)
         date_str = soup.find("span", class_="post-date").find("time").string
         return {
             "date": string_to_date(date_str, "%d %b %Y"),
-            "img": [i["content"] for i in imgs],
-            "title": title,
-            "description": desc,
+            "img": metas.get(("property", "og:image"), []),
+            "title": metas["property", "og:title"][0],
+            "description": metas["property", "og:description"][0],
         }
 
 
@@ -1956,7 +2027,8 @@ class Wondermark(GenericListableComic):
     @classmethod
     def get_archive_elements(cls):
         archive_url = urljoin_wrapper(cls.url, "archive/")
-        return reversed(get_soup_at_url(archive_url).find_all("a", rel="bookmark"))
+        strainer = SoupStrainer("a", rel="bookmark")
+        return reversed(get_soup_at_url(archive_url, parse_only=strainer).find_all("a"))
 
     @classmethod
     def get_comic_info(cls, soup, link):
@@ -2145,9 +2217,7 @@ class PicturesInBoxes(GenericDeletedComic, GenericNavigableComic):
     @classmethod
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
-        title = soup.find("h2", class_="post-title").string
-        author = soup.find("span", class_="post-author").find("a").string
-        date_str = soup.find("span", class_="post-date").string
+        title, author, date_str = get_post_title_author_date(soup)
         imgs = soup.find("div", class_="comicpane").find_all("img")
         assert imgs
         assert all(i["title"] == i["alt"] == title for i in imgs)
@@ -2192,11 +2262,13 @@ class TheDoghouseDiaries(GenericComicNotWorking, GenericNavigableComic):
     name = "doghouse"
     long_name = "The Dog House Diaries"
     url = "http://thedoghousediaries.com"
+    img_re = re.compile("^dhdcomics/.*")
 
     @classmethod
     def get_first_comic_link(cls):
         """Get link to first comics."""
-        return get_soup_at_url(cls.url).find("a", id="firstlink")
+        strainer = SoupStrainer("a", id="firstlink")
+        return get_soup_at_url(cls.url, parse_only=strainer).find("a")
 
     @classmethod
     def get_navi_link(cls, last_soup, next_):
@@ -2206,8 +2278,7 @@ class TheDoghouseDiaries(GenericComicNotWorking, GenericNavigableComic):
     @classmethod
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
-        img_re = re.compile("^dhdcomics/.*")
-        img = soup.find("img", src=img_re)
+        img = soup.find("img", src=cls.img_re)
         comic_url = cls.get_url_from_link(link)
         return {
             "title": soup.find("h2", id="titleheader").string,
@@ -2225,13 +2296,14 @@ class InvisibleBread(GenericListableComic):
     name = "invisiblebread"
     long_name = "Invisible Bread"
     url = "https://invisiblebread.com"
+    link_re = re.compile("^%s/([0-9]+)/" % url)
 
     @classmethod
     def get_archive_elements(cls):
         archive_url = urljoin_wrapper(cls.url, "archives/")
-        return reversed(
-            get_soup_at_url(archive_url).find_all("td", class_="archive-title")
-        )
+        # Rows are kept whole as comic info relies on sibling cells
+        soup = get_soup_at_url(archive_url, parse_only=SoupStrainer("tr"))
+        return reversed(soup.find_all("td", class_="archive-title"))
 
     @classmethod
     def get_url_from_archive_element(cls, td):
@@ -2243,8 +2315,7 @@ class InvisibleBread(GenericListableComic):
         url = cls.get_url_from_archive_element(td)
         title = td.find("a").string
         month_and_day = td.previous_sibling.string
-        link_re = re.compile("^%s/([0-9]+)/" % cls.url)
-        year = link_re.match(url).group(1)
+        year = cls.link_re.match(url).group(1)
         date_str = month_and_day + " " + year
         imgs = [soup.find("div", id="comic").find("img")]
         assert len(imgs) == 1, imgs
@@ -2312,6 +2383,7 @@ class PoorlyDrawnLines(GenericListableComic):
     url = "https://poorlydrawnlines.com"
     _categories = ("POORLYDRAWN",)
     get_url_from_archive_element = get_href
+    comic_url_re = re.compile("^%s/comic/." % url)
 
     @classmethod
     def get_comic_info(cls, soup, link):
@@ -2325,8 +2397,8 @@ class PoorlyDrawnLines(GenericListableComic):
     @classmethod
     def get_archive_elements(cls):
         archive_url = urljoin_wrapper(cls.url, "archive")
-        url_re = re.compile("^%s/comic/." % cls.url)
-        return reversed(get_soup_at_url(archive_url).find_all("a", href=url_re))
+        strainer = SoupStrainer("a", href=cls.comic_url_re)
+        return reversed(get_soup_at_url(archive_url, parse_only=strainer).find_all("a"))
 
 
 class LoadingComics(GenericNavigableComic):
@@ -2383,11 +2455,10 @@ class DepressedAlien(GenericNavigableComic):
     @classmethod
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
-        title = soup.find("meta", attrs={"name": "twitter:title"})["content"]
-        imgs = soup.find_all("meta", property="og:image")
+        metas = get_meta_contents(soup)
         return {
-            "title": title,
-            "img": [i["content"] for i in imgs],
+            "title": metas["name", "twitter:title"][0],
+            "img": metas.get(("property", "og:image"), []),
         }
 
 
@@ -2409,11 +2480,10 @@ class TurnOffUs(GenericListableComic):
     @classmethod
     def get_comic_info(cls, soup, archive_elt):
         """Get information about a particular comics."""
-        title = soup.find("meta", property="og:title")["content"]
-        imgs = soup.find_all("meta", property="og:image")
+        metas = get_meta_contents(soup)
         return {
-            "title": title,
-            "img": [i["content"] for i in imgs],
+            "title": metas["property", "og:title"][0],
+            "img": metas.get(("property", "og:image"), []),
         }
 
 
@@ -2433,20 +2503,14 @@ class ThingsInSquares(GenericListableComic):
         a = td2.find("a")
         date_str = td3.string
         title = a.string
-        title2 = soup.find("meta", property="og:title")["content"]
-        desc = soup.find("meta", property="og:description")
-        description = desc["content"] if desc else ""
-        tags = " ".join(
-            t["content"] for t in soup.find_all("meta", property="article:tag")
-        )
-        imgs = soup.find_all("meta", property="og:image")
+        metas = get_meta_contents(soup)
         return {
             "date": string_to_date(date_str, "%m.%d.%y"),
             "title": title,
-            "title2": title2,
-            "description": description,
-            "tags": tags,
-            "img": [i["content"] for i in imgs],
+            "title2": metas["property", "og:title"][0],
+            "description": metas.get(("property", "og:description"), [""])[0],
+            "tags": " ".join(metas.get(("property", "article:tag"), [])),
+            "img": metas.get(("property", "og:image"), []),
         }
 
     @classmethod
@@ -2457,7 +2521,8 @@ class ThingsInSquares(GenericListableComic):
     @classmethod
     def get_archive_elements(cls):
         archive_url = urljoin_wrapper(cls.url, "archive-2")
-        return reversed(get_soup_at_url(archive_url).find("tbody").find_all("tr"))
+        soup = get_soup_at_url(archive_url, parse_only=SoupStrainer("tbody"))
+        return reversed(soup.find("tbody").find_all("tr"))
 
 
 class HappleTea(GenericNavigableComic):
@@ -2533,12 +2598,11 @@ class PeterLauris(GenericNavigableComic):
     @classmethod
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
-        title = soup.find("meta", attrs={"name": "twitter:title"})["content"]
-        date_str = soup.find("meta", property="article:published_time")["content"]
-        imgs = soup.find_all("meta", property="og:image")
+        metas = get_meta_contents(soup)
+        date_str = metas["property", "article:published_time"][0]
         return {
-            "title": title,
-            "img": [i["content"] for i in imgs],
+            "title": metas["name", "twitter:title"][0],
+            "img": metas.get(("property", "og:image"), []),
             "date": isoformat_to_date(date_str),
         }
 
@@ -2556,16 +2620,15 @@ class RandomCrab(GenericNavigableComic):
     @classmethod
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
-        title = soup.find("meta", property="og:title")["content"]
-        desc = soup.find("meta", property="og:description")
-        desc_str = "" if desc is None else desc["content"]
-        date_str = soup.find("meta", property="article:published_time")["content"]
-        imgs = soup.find_all("meta", property="og:image")
+        metas = get_meta_contents(soup)
+        title = metas["property", "og:title"][0]
+        desc_str = metas.get(("property", "og:description"), [""])[0]
+        date_str = metas["property", "article:published_time"][0]
         author = soup.find("a", rel="author").string
         return {
             "title": title,
             "desc": desc_str,
-            "img": [i["content"] for i in imgs],
+            "img": metas.get(("property", "og:image"), []),
             "date": isoformat_to_date(date_str),
             "author": author,
         }
@@ -2582,7 +2645,8 @@ class JuliasDrawings(GenericListableComic):
 
     @classmethod
     def get_archive_elements(cls):
-        div = get_soup_at_url(cls.url).find("div", class_="drawings")
+        strainer = SoupStrainer("div", class_="drawings")
+        div = get_soup_at_url(cls.url, parse_only=strainer).find("div")
         return reversed(div.find_all("a"))
 
     @classmethod
@@ -2611,12 +2675,9 @@ class AnythingComic(GenericComicNotWorking, GenericListableComic):
     @classmethod
     def get_archive_elements(cls):
         archive_url = urljoin_wrapper(cls.url, "archive/")
+        strainer = SoupStrainer("table", id="chapter_table")
         # The first 2 <tr>'s do not correspond to comics
-        return (
-            get_soup_at_url(archive_url)
-            .find("table", id="chapter_table")
-            .find_all("tr")[2:]
-        )
+        return get_soup_at_url(archive_url, parse_only=strainer).find_all("tr")[2:]
 
     @classmethod
     def get_url_from_archive_element(cls, tr):
@@ -2685,8 +2746,9 @@ class HowDnsWorksComics(GenericListableComic):
 
     @classmethod
     def get_archive_elements(cls):
-        soup = get_soup_at_url(urljoin_wrapper(cls.url, "episodes"))
-        return soup.find("ul", class_="episode-list").find_all("a")
+        archive_url = urljoin_wrapper(cls.url, "episodes")
+        strainer = SoupStrainer("ul", class_="episode-list")
+        return get_soup_at_url(archive_url, parse_only=strainer).find_all("a")
 
     @classmethod
     def get_comic_info(cls, soup, archive_elt):
@@ -2716,8 +2778,9 @@ class HowHttpsWorksComics(GenericListableComic):
 
     @classmethod
     def get_archive_elements(cls):
-        soup = get_soup_at_url(urljoin_wrapper(cls.url, "episodes"))
-        return soup.find_all("a", class_="db link black dim")
+        archive_url = urljoin_wrapper(cls.url, "episodes")
+        strainer = SoupStrainer("a", class_="db link black dim")
+        return get_soup_at_url(archive_url, parse_only=strainer).find_all("a")
 
     @classmethod
     def get_comic_info(cls, soup, archive_elt):
@@ -2785,13 +2848,11 @@ class WarAndPeas(GenericComicNotWorking, GenericNavigableComic):
     @classmethod
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
-        title = soup.find("meta", property="og:title")["content"]
-        imgs = soup.find_all("meta", property="og:image")
-        date_str = soup.find("meta", property="article:published_time")["content"]
+        metas = get_meta_contents(soup)
         return {
-            "title": title,
-            "img": [i["content"] for i in imgs],
-            "date": isoformat_to_date(date_str),
+            "title": metas["property", "og:title"][0],
+            "img": metas.get(("property", "og:image"), []),
+            "date": isoformat_to_date(metas["property", "article:published_time"][0]),
         }
 
 
@@ -2850,9 +2911,7 @@ class GerbilWithAJetpack(GenericNavigableComic):
     @classmethod
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
-        title = soup.find("h2", class_="post-title").string
-        author = soup.find("span", class_="post-author").find("a").string
-        date_str = soup.find("span", class_="post-date").string
+        title, author, date_str = get_post_title_author_date(soup)
         imgs = soup.find("div", id="comic").find_all("img")
         alt = imgs[0]["alt"]
         assert all(i["alt"] == i["title"] == alt for i in imgs)
@@ -2877,9 +2936,7 @@ class EveryDayBlues(GenericDeletedComic, GenericNavigableComic):
     @classmethod
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
-        title = soup.find("h2", class_="post-title").string
-        author = soup.find("span", class_="post-author").find("a").string
-        date_str = soup.find("span", class_="post-date").string
+        title, author, date_str = get_post_title_author_date(soup)
         imgs = soup.find("div", id="comic").find_all("img")
         assert all(i["alt"] == i["title"] == title for i in imgs)
         assert len(imgs) <= 1, imgs
@@ -2991,9 +3048,7 @@ class MisterAndMe(GenericNavigableComic):
     @classmethod
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
-        title = soup.find("h2", class_="post-title").string
-        author = soup.find("span", class_="post-author").find("a").string
-        date_str = soup.find("span", class_="post-date").string
+        title, author, date_str = get_post_title_author_date(soup)
         imgs = soup.find("div", id="comic").find_all("img")
         assert all(i["alt"] == i["title"] for i in imgs)
         assert len(imgs) <= 1, imgs
@@ -3020,17 +3075,13 @@ class LastPlaceComics(GenericNavigableComic):
     @classmethod
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
-        title = soup.find("meta", property="og:title")["content"]
-        author = soup.find("meta", attrs={"name": "twitter:data1"})["content"]
-        date_str = soup.find("meta", property="article:published_time")["content"]
-        desc = soup.find("meta", property="og:description")["content"]
-        imgs = soup.find_all("meta", property="og:image")
+        metas = get_meta_contents(soup)
         return {
-            "img": [i["content"] for i in imgs],
-            "title": title,
-            "author": author,
-            "description": desc,
-            "date": isoformat_to_date(date_str),
+            "img": metas.get(("property", "og:image"), []),
+            "title": metas["property", "og:title"][0],
+            "author": metas["name", "twitter:data1"][0],
+            "description": metas["property", "og:description"][0],
+            "date": isoformat_to_date(metas["property", "article:published_time"][0]),
         }
 
 
@@ -3049,9 +3100,7 @@ class TalesOfAbsurdity(GenericNavigableComic):
     @classmethod
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
-        title = soup.find("h2", class_="post-title").string
-        author = soup.find("span", class_="post-author").find("a").string
-        date_str = soup.find("span", class_="post-date").string
+        title, author, date_str = get_post_title_author_date(soup)
         imgs = soup.find("div", id="comic").find_all("img")
         assert all(i["alt"] == i["title"] for i in imgs)
         alt = imgs[0]["alt"] if imgs else ""
@@ -3113,8 +3162,9 @@ class GenericCommitStrip(GenericNavigableComic):
     @classmethod
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
-        desc = soup.find("meta", property="og:description")["content"]
-        title = soup.find("meta", property="og:title")["content"]
+        metas = get_meta_contents(soup)
+        desc = metas["property", "og:description"][0]
+        title = metas["property", "og:title"][0]
         imgs = soup.find("div", class_="entry-content").find_all("img")
         title2 = " ".join(i.get("title", "") for i in imgs)
         return {
@@ -3159,10 +3209,8 @@ class GenericBoumerie(GenericNavigableComic):
     @classmethod
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
-        title = soup.find("h2", class_="post-title").string
+        title, author, date_str = get_post_title_author_date(soup)
         short_url = soup.find("link", rel="shortlink")["href"]
-        author = soup.find("span", class_="post-author").find("a").string
-        date_str = soup.find("span", class_="post-date").string
         imgs = soup.find("div", id="comic").find_all("img")
         assert all(i["alt"] == i["title"] for i in imgs)
         return {
@@ -3240,13 +3288,11 @@ class Optipess(GenericNavigableComic):
     @classmethod
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
-        title = soup.find("h2", class_="post-title").string
-        author = soup.find("span", class_="post-author").find("a").string
+        title, author, date_str = get_post_title_author_date(soup)
         comic = soup.find("div", id="comic")
         imgs = comic.find_all("img") if comic else []
         alt = imgs[0]["title"] if imgs else ""
         assert all(i["alt"] == i["title"] == alt for i in imgs)
-        date_str = soup.find("span", class_="post-date").string
         return {
             "title": title,
             "alt": alt,
@@ -3263,6 +3309,7 @@ class PainTrainComic(GenericNavigableComic):
     name = "paintrain"
     long_name = "Pain Train Comics"
     url = "http://paintraincomic.com"
+    short_url_re = re.compile("^%s/\\?p=([0-9]*)" % url)
     get_first_comic_link = get_a_navi_navifirst
     get_navi_link = get_link_rel_next
 
@@ -3271,8 +3318,7 @@ class PainTrainComic(GenericNavigableComic):
         """Get information about a particular comics."""
         title = soup.find("h2", class_="post-title").string
         short_url = soup.find("link", rel="shortlink")["href"]
-        short_url_re = re.compile("^%s/\\?p=([0-9]*)" % cls.url)
-        num = int(short_url_re.match(short_url).group(1))
+        num = int(cls.short_url_re.match(short_url).group(1))
         imgs = soup.find("div", id="comic").find_all("img")
         alt = imgs[0]["title"]
         assert all(i["alt"] == i["title"] == alt for i in imgs)
@@ -3295,6 +3341,7 @@ class MoonBeard(GenericNavigableComic):
     name = "moonbeard"
     long_name = "Moon Beard"
     url = "https://moonbeard.com"
+    short_url_re = re.compile("^%s/\\?p=([0-9]*)" % url)
     _categories = ("MOONBEARD",)
     get_first_comic_link = get_a_navi_navifirst
     get_navi_link = get_a_navi_navinext
@@ -3304,8 +3351,7 @@ class MoonBeard(GenericNavigableComic):
         """Get information about a particular comics."""
         title = soup.find("h2", class_="post-title").string
         short_url = soup.find("link", rel="shortlink")["href"]
-        short_url_re = re.compile("^%s/\\?p=([0-9]*)" % cls.url)
-        num = int(short_url_re.match(short_url).group(1))
+        num = int(cls.short_url_re.match(short_url).group(1))
         imgs = soup.find("div", id="comic").find_all("img")
         alt = imgs[0]["title"]
         assert all(i["alt"] == i["title"] == alt for i in imgs)
@@ -3342,8 +3388,9 @@ class SystemComic(GenericNavigableComic):
     @classmethod
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
-        title = soup.find("meta", property="og:title")["content"]
-        desc = soup.find("meta", property="og:description")["content"]
+        metas = get_meta_contents(soup)
+        title = metas["property", "og:title"][0]
+        desc = metas["property", "og:description"][0]
         date_str = soup.find("time")["datetime"]
         imgs = soup.find("figure").find_all("img")
         return {
@@ -3375,9 +3422,9 @@ class LittleLifeLines(GenericNavigableComic):
     @classmethod
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
-        title = soup.find("meta", property="og:title")["content"]
-        desc = soup.find("meta", property="og:description")
-        desc_str = "" if desc is None else desc["content"]
+        metas = get_meta_contents(soup)
+        title = metas["property", "og:title"][0]
+        desc_str = metas.get(("property", "og:description"), [""])[0]
         date_str = soup.find("time", class_="published")["datetime"]
         author = soup.find("a", rel="author").string
         div_content = soup.find("div", class_="body entry-content")
@@ -3407,14 +3454,12 @@ class Jenkins(GenericNavigableComic):
     @classmethod
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
-        title = soup.find("meta", property="og:title")["content"]
-        date_str = soup.find("meta", property="article:published_time")["content"]
-        imgs = soup.find_all("meta", property="og:image")
+        metas = get_meta_contents(soup)
         author = soup.find("span", class_="author vcard").find("a").string
         return {
-            "title": title,
-            "date": isoformat_to_date(date_str),
-            "img": [i["content"] for i in imgs],
+            "title": metas["property", "og:title"][0],
+            "date": isoformat_to_date(metas["property", "article:published_time"][0]),
+            "img": metas.get(("property", "og:image"), []),
             "author": author,
         }
 
@@ -3423,24 +3468,16 @@ class GenericWordPressInkblot(GenericNavigableComic):
     """Generic class to retrieve comics using WordPress with Inkblot."""
 
     get_navi_link = get_link_rel_next
-
-    @classmethod
-    def get_first_comic_link(cls):
-        """Get link to first comics."""
-        return get_soup_at_url(cls.url).find(
-            "a",
-            class_="webcomic-link webcomic1-link first-webcomic-link first-webcomic1-link",
-        )
+    get_first_comic_link = get_a_webcomic_first
 
     @classmethod
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
-        title = soup.find("meta", property="og:title")["content"]
+        metas = get_meta_contents(soup)
         imgs = soup.find("div", class_="webcomic-image").find_all("img")
-        date_str = soup.find("meta", property="article:published_time")["content"]
         return {
-            "title": title,
-            "date": isoformat_to_date(date_str),
+            "title": metas["property", "og:title"][0],
+            "date": isoformat_to_date(metas["property", "article:published_time"][0]),
             "img": [i["src"] for i in imgs],
         }
 
@@ -3472,14 +3509,7 @@ class WoodenPlankStudios(GenericNavigableComic):
     name = "woodenplank"
     long_name = "Wooden Plank Studios"
     url = "https://www.woodenplankstudios.com"
-
-    @classmethod
-    def get_first_comic_link(cls):
-        """Get link to first comics."""
-        return get_soup_at_url(cls.url).find(
-            "a",
-            class_="webcomic-link webcomic1-link first-webcomic-link first-webcomic1-link",
-        )
+    get_first_comic_link = get_a_webcomic_first
 
     @classmethod
     def get_navi_link(cls, last_soup, next_):
@@ -3522,11 +3552,10 @@ class ElectricBunnyComic(GenericNavigableComic):
     @classmethod
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
-        title = soup.find("meta", property="og:title")["content"]
-        imgs = soup.find_all("meta", property="og:image")
+        metas = get_meta_contents(soup)
         return {
-            "title": title,
-            "img": [i["content"] for i in imgs],
+            "title": metas["property", "og:title"][0],
+            "img": metas.get(("property", "og:image"), []),
         }
 
 
@@ -3725,8 +3754,9 @@ class PomComics(GenericNavigableComic):
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
         title = soup.find("h1").string
-        desc = soup.find("meta", property="og:description")["content"]
-        tags = soup.find("meta", attrs={"name": "keywords"})["content"]
+        metas = get_meta_contents(soup)
+        desc = metas["property", "og:description"][0]
+        tags = metas["name", "keywords"][0]
         imgs = soup.find("div", class_="comic").find_all("img")
         return {
             "title": title,
@@ -3762,8 +3792,9 @@ class CubeDrone(GenericComicNotWorking, GenericNavigableComic):  # Website has c
     @classmethod
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
-        title = soup.find("meta", attrs={"name": "twitter:title"})["content"]
-        url2 = soup.find("meta", attrs={"name": "twitter:url"})["content"]
+        metas = get_meta_contents(soup)
+        title = metas["name", "twitter:title"][0]
+        url2 = metas["name", "twitter:url"][0]
         # date_str = soup.find('h2', class_='comic_title').find('small').string
         # day = string_to_date(date_str, "%B %d, %Y, %I:%M %p")
         imgs = soup.find_all("img", class_="comic img-responsive")
@@ -3788,7 +3819,10 @@ class MakeItStoopid(GenericDeletedComic, GenericNavigableComic):
     @classmethod
     def get_nav(cls, soup):
         """Get the navigation elements from soup object."""
-        cnav = soup.find_all(class_="cnav")
+        # Navigation is present twice (5 elements each): no need to look
+        # further than an 11th element, which would mean the layout changed
+        cnav = soup.find_all(class_="cnav", limit=11)
+        assert len(cnav) == 10, len(cnav)
         nav1, nav2 = cnav[:5], cnav[5:]
         assert nav1 == nav2
         # begin, prev, archive, next_, end = nav1
@@ -3877,13 +3911,11 @@ class WorkChroniclesComics(GenericNavigableComic):
     @classmethod
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
-        title = soup.find("meta", property="og:title")["content"]
-        date_str = soup.find("meta", property="article:published_time")["content"]
-        imgs = soup.find_all("meta", property="og:image")
+        metas = get_meta_contents(soup)
         return {
-            "img": [i["content"] for i in imgs],
-            "date": isoformat_to_date(date_str),
-            "title": title,
+            "img": metas.get(("property", "og:image"), []),
+            "date": isoformat_to_date(metas["property", "article:published_time"][0]),
+            "title": metas["property", "og:title"][0],
         }
 
 
@@ -3904,14 +3936,12 @@ class LightRoastComics(GenericNavigableComic):
     @classmethod
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
-        imgs = soup.find_all("meta", property="og:image")
-        date_str = soup.find("meta", property="article:published_time")["content"]
-        title = soup.find("meta", property="og:title")["content"]
+        metas = get_meta_contents(soup)
         author = soup.find("span", class_="author vcard").find("a").string
         return {
-            "img": [i["content"] for i in imgs],
-            "date": isoformat_to_date(date_str),
-            "title": title,
+            "img": metas.get(("property", "og:image"), []),
+            "date": isoformat_to_date(metas["property", "article:published_time"][0]),
+            "title": metas["property", "og:title"][0],
             "author": author,
             "tags": " ".join(t.string for t in soup.find_all("a", rel="category tag")),
         }
@@ -3930,13 +3960,11 @@ class MarketoonistComics(GenericNavigableComic):
     @classmethod
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
-        imgs = soup.find_all("meta", property="og:image")
-        date_str = soup.find("meta", property="article:published_time")["content"]
-        title = soup.find("meta", property="og:title")["content"]
+        metas = get_meta_contents(soup)
         return {
-            "img": [i["content"] for i in imgs],
-            "date": isoformat_to_date(date_str),
-            "title": title,
+            "img": metas.get(("property", "og:image"), []),
+            "date": isoformat_to_date(metas["property", "article:published_time"][0]),
+            "title": metas["property", "og:title"][0],
         }
 
 
@@ -3961,12 +3989,11 @@ class ConsoliaComics(GenericNavigableComic):
     @classmethod
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
-        title = soup.find("meta", property="og:title")["content"]
+        metas = get_meta_contents(soup)
         date_str = soup.find("time")["datetime"]
-        imgs = soup.find_all("meta", property="og:image")
         return {
-            "title": title,
-            "img": [i["content"] for i in imgs],
+            "title": metas["property", "og:title"][0],
+            "img": metas.get(("property", "og:image"), []),
             "date": string_to_date(date_str, "%Y-%m-%d"),
         }
 
@@ -4052,9 +4079,9 @@ class GeekAndPoke(GenericNavigableComic):
     @classmethod
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
-        title = soup.find("meta", property="og:title")["content"]
-        desc = soup.find("meta", property="og:description")
-        desc_str = "" if desc is None else desc["content"]
+        metas = get_meta_contents(soup)
+        title = metas["property", "og:title"][0]
+        desc_str = metas.get(("property", "og:description"), [""])[0]
         date_str = soup.find("time", class_="published")["datetime"]
         author = soup.find("a", rel="author").string
         div_content = soup.find("div", class_="body entry-content") or soup.find(
@@ -4117,18 +4144,15 @@ class AtRandomComics(GenericNavigableComic):
     @classmethod
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
-        title = soup.find("meta", property="og:title")["content"]
-        desc = soup.find("meta", property="og:description")
-        description = desc["content"] if desc else ""
+        metas = get_meta_contents(soup)
         date_str = soup.find("time", itemprop="datePublished")["datetime"]
         author = soup.find("a", rel="author").string
-        imgs = soup.find_all("meta", property="og:image")
         return {
-            "title": title,
-            "img": [i["content"] for i in imgs],
+            "title": metas["property", "og:title"][0],
+            "img": metas.get(("property", "og:image"), []),
             "date": string_to_date(date_str, "%Y-%m-%d"),
             "author": author,
-            "description": description,
+            "description": metas.get(("property", "og:description"), [""])[0],
         }
 
 
@@ -4156,15 +4180,12 @@ class NothingSuspicious(GenericDeletedComic, GenericNavigableComic):
     @classmethod
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
-        title = soup.find("meta", property="og:title")["content"]
-        date_str = soup.find("meta", itemprop="datePublished")["content"]
-        author = soup.find("meta", itemprop="author")["content"]
-        imgs = soup.find_all("meta", property="og:image")
+        metas = get_meta_contents(soup)
         return {
-            "title": title,
-            "img": [i["content"] for i in imgs],
-            "date": isoformat_to_date(date_str),
-            "author": author,
+            "title": metas["property", "og:title"][0],
+            "img": metas.get(("property", "og:image"), []),
+            "date": isoformat_to_date(metas["itemprop", "datePublished"][0]),
+            "author": metas["itemprop", "author"][0],
         }
 
 
@@ -4240,6 +4261,8 @@ class GenericTumblrV1(GenericPaginatedListableComic):
     """Generic class to retrieve comics from Tumblr using the V1 API."""
 
     _categories = ("TUMBLR",)
+    # Number of archive pages retrieved concurrently
+    nb_prefetched_pages = 4
 
     @classmethod
     def check_url(cls, url):
@@ -4275,7 +4298,7 @@ class GenericTumblrV1(GenericPaginatedListableComic):
         return {
             "url": cls.check_url(elt["url"]),
             "url2": elt["url-with-slug"],
-            "date": datetime.datetime.fromtimestamp(int(elt["unix-timestamp"])).date(),
+            "date": date.fromtimestamp(int(elt["unix-timestamp"])),
             "title": title,
             "tags": tags,
             "img": [i.string for i in imgs],
@@ -4292,11 +4315,12 @@ class GenericTumblrV1(GenericPaginatedListableComic):
         assert last_comic is not None
         cls.check_url(last_comic["api_url"])
         last_api_url = cls.get_api_url_for_id(last_comic["tumblr-id"])
+        # Only the existence of the documents matters
         try:
-            get_soup_at_url(last_api_url)
+            get_headers_at_url(last_api_url)
         except urllib.error.HTTPError:
             try:
-                get_soup_at_url(cls.url)
+                get_headers_at_url(cls.url)
             except urllib.error.HTTPError:
                 print("Did not find previous post nor main url %s" % cls.url)
             else:
@@ -4317,26 +4341,54 @@ class GenericTumblrV1(GenericPaginatedListableComic):
         Elements are retrieved as per the tumblr v1 api."""
         nb_post_per_call = 10  # max 50
         api_url = cls.get_api_url()
-        soup = get_soup_at_url(api_url)
+        api_url_fmt = api_url + "?start=%d&num=" + str(nb_post_per_call)
+        # Only posts are needed (not the tumblelog description, etc)
+        strainer = SoupStrainer("posts")
+        # First page is used both to get the number of posts and the first posts
+        first_url = api_url_fmt % 0
+        soup = get_xml_soup_at_url(first_url, parse_only=strainer)
         posts = soup.find("posts")
         if posts is None:
             cls.log(
                 "Could not get post info from url %s - problem with GDPR disclaimer?"
-                % api_url
+                % first_url
             )
             return
 
         start, total = int(posts["start"]), int(posts["total"])
         assert start == 0
-        for starting_num in range(0, total, nb_post_per_call):
-            api_url2 = api_url + "?start=%d&num=%d" % (starting_num, nb_post_per_call)
-            posts2 = get_soup_at_url(api_url2).find("posts")
-            start2, total2 = int(posts2["start"]), int(posts2["total"])
-            assert starting_num == start2, "%d != %d" % (starting_num, start2)
-            # This may happen and should be handled in the future
-            assert total == total2, "%d != %d" % (total, total2)
-            for e in posts2.find_all("post"):
-                yield e
+        # The last known comic is usually on the first page: other pages are
+        # only requested once all of its posts have been used
+        for e in posts.find_all("post"):
+            yield e
+        starting_nums = range(nb_post_per_call, total, nb_post_per_call)
+        api_urls = [api_url_fmt % starting_num for starting_num in starting_nums]
+        # The next few pages are retrieved concurrently, at the cost of a few
+        # unneeded pages once the last known comic is found
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=cls.nb_prefetched_pages
+        ) as executor:
+            next_page = cls.nb_prefetched_pages
+            soups = collections.deque(
+                executor.submit(get_xml_soup_at_url, url, strainer)
+                for url in api_urls[:next_page]
+            )
+            for starting_num in starting_nums:
+                posts2 = soups.popleft().result().find("posts")
+                if next_page < len(api_urls):
+                    url = api_urls[next_page]
+                    future = executor.submit(get_xml_soup_at_url, url, strainer)
+                    soups.append(future)
+                    next_page += 1
+                start2 = int(posts2["start"])
+                assert starting_num == start2, "%d != %d" % (starting_num, start2)
+                # This may happen and should be handled in the future
+                assert total == int(posts2["total"]), "%d != %s" % (
+                    total,
+                    posts2["total"],
+                )
+                for e in posts2.find_all("post"):
+                    yield e
 
 
 class GenericDeletedTumblrV1(GenericDeletedComic, GenericTumblrV1):
@@ -4350,7 +4402,7 @@ class GenericDeletedTumblrV1(GenericDeletedComic, GenericTumblrV1):
     def url_is_reachable(cls, url):
         "Check if a given url is reachable. Return True or False."""
         try:
-            get_soup_at_url(url)
+            get_headers_at_url(url)
             return True
         except urllib.error.HTTPError:
             return False
@@ -4364,11 +4416,13 @@ class GenericDeletedTumblrV1(GenericDeletedComic, GenericTumblrV1):
         if last_comic is not None:
             urls.append(last_comic["api_url"])
             urls.append(last_comic["url"])
-        for url in urls:
-            if cls.url_is_reachable(url):
-                print(
-                    "Tumblr is expected to be deleted but URL %s is reachable" % (url)
-                )
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(urls)) as executor:
+            for url, reachable in zip(urls, executor.map(cls.url_is_reachable, urls)):
+                if reachable:
+                    print(
+                        "Tumblr is expected to be deleted but URL %s is reachable"
+                        % (url)
+                    )
 
     @classmethod
     def get_next_comic(cls, last_comic):
@@ -5642,10 +5696,7 @@ class RustledJimmies(GenericNavigableComic):
             "author": author,
             "date": isoformat_to_date(date_str),
             "img": [
-                urljoin_wrapper(
-                    cls.url, i["data-src"] if i.has_attr("data-src") else i["src"]
-                )
-                for i in imgs
+                urljoin_wrapper(cls.url, i.get("data-src") or i["src"]) for i in imgs
             ],
         }
 
@@ -5834,12 +5885,12 @@ class HorovitzComics(GenericDeletedComic, GenericListableComic):
         href = link["href"]
         num = int(cls.link_re.match(href).group(1))
         title = link.string
-        imgs = soup.find_all("img", id="comic")
-        assert len(imgs) == 1, imgs
+        # Ids are unique: no need to look further than the first match
+        img_src = soup.find("img", id="comic")["src"]
         return {
             "title": title,
-            "date": regexp_match_to_date(cls.img_re.match(imgs[0]["src"])),
-            "img": [i["src"] for i in imgs],
+            "date": regexp_match_to_date(cls.img_re.match(img_src)),
+            "img": [img_src],
             "num": num,
         }
 
@@ -5869,46 +5920,48 @@ class GenericGoComic(GenericNavigableComic):
     """Generic class to handle the logic common to comics from gocomics.com."""
 
     _categories = ("GOCOMIC",)
+    gocomics_url = "http://www.gocomics.com"
+    first_link_class = "fa btn btn-outline-secondary btn-circle fa fa-backward sm"
+    prev_link_class = (
+        "fa btn btn-outline-secondary btn-circle fa-caret-left sm js-previous-comic"
+    )
+    next_link_class = "fa btn btn-outline-secondary btn-circle fa-caret-right sm"
 
     @classmethod
     def get_first_comic_link(cls):
         """Get link to first comics."""
         comics_link = get_soup_at_url(cls.url).find("a", attrs={"data-link": "comics"})
         comics_page = get_soup_at_url(cls.get_url_from_link(comics_link))
-        class_ = "fa btn btn-outline-secondary btn-circle fa fa-backward sm"
-        return comics_page.find("a", class_=class_) or comics_page.find(
-            "a", class_=class_ + " "
-        )
+        return comics_page.find("a", class_=cls.get_link_classes(cls.first_link_class))
 
     @classmethod
     def get_navi_link(cls, last_soup, next_):
         """Get link to next or previous comic."""
-        PREV = (
-            "fa btn btn-outline-secondary btn-circle fa-caret-left sm js-previous-comic"
-        )
-        NEXT = "fa btn btn-outline-secondary btn-circle fa-caret-right sm"
-        class_ = NEXT if next_ else PREV
-        return last_soup.find("a", class_=class_) or last_soup.find(
-            "a", class_=class_ + " "
-        )
+        class_ = cls.next_link_class if next_ else cls.prev_link_class
+        return last_soup.find("a", class_=cls.get_link_classes(class_))
+
+    @classmethod
+    def get_link_classes(cls, class_):
+        """Get class values to look for in a single pass.
+
+        Depending on the parser, a trailing space may be kept in the class."""
+        return [class_, class_ + " "]
 
     @classmethod
     def get_url_from_link(cls, link):
-        gocomics = "http://www.gocomics.com"
-        return urljoin_wrapper(gocomics, link["href"])
+        return urljoin_wrapper(cls.gocomics_url, link["href"])
 
     @classmethod
     def get_comic_info(cls, soup, link):
         """Get information about a particular comics."""
-        date_str = soup.find("meta", property="article:published_time")["content"]
-        imgs = soup.find_all("meta", property="og:image")
-        author = soup.find("meta", property="article:author")["content"]
-        tags = soup.find("meta", property="article:tag")["content"]
+        metas = get_meta_contents(soup)
         return {
-            "date": string_to_date(date_str, "%Y-%m-%d"),
-            "img": [i["content"] for i in imgs],
-            "author": author,
-            "tags": tags,
+            "date": string_to_date(
+                metas["property", "article:published_time"][0], "%Y-%m-%d"
+            ),
+            "img": metas.get(("property", "og:image"), []),
+            "author": metas["property", "article:author"][0],
+            "tags": metas["property", "article:tag"][0],
         }
 
 
@@ -6244,11 +6297,12 @@ class GenericTapasComic(GenericPaginatedListableComic):
     def last_comic_is_valid(cls, last_comic):
         """Check that last comic seems to be valid."""
         last_url = last_comic["url"]
+        # Only the existence of the pages matters
         try:
-            get_soup_at_url(last_url)
+            get_headers_at_url(last_url)
         except urllib.error.HTTPError:
             try:
-                get_soup_at_url(cls.url)
+                get_headers_at_url(cls.url)
             except urllib.error.HTTPError:
                 print("Did not find previous post nor main url %s" % cls.url)
             else:
@@ -7138,6 +7192,36 @@ def get_subclasses(klass):
     return subclasses
 
 
+def get_meta_contents(soup):
+    """Get the content of meta elements from a soup object in a single pass.
+
+    Returns a dict mapping (attribute, value) tuples for the 'property',
+    'name' and 'itemprop' attributes to the list of corresponding contents
+    (some meta elements such as 'og:image' can be present multiple times).
+    The attribute is part of the key as pages may use the same value with
+    different attributes (and different contents)."""
+    metas = {}
+    for meta in soup.find_all("meta"):
+        content = meta.get("content")
+        if content is not None:
+            for attr in ("property", "name", "itemprop"):
+                value = meta.get(attr)
+                if value is not None:
+                    metas.setdefault((attr, value), []).append(content)
+    return metas
+
+
+def get_post_title_author_date(soup):
+    """Get the title, author and date strings of a ComicPress-like post.
+
+    The author and the date come after the title in the page so they are
+    looked for from there instead of from the beginning of the document."""
+    title = soup.find("h2", class_="post-title")
+    author = title.find_next("span", class_="post-author").find("a")
+    date = title.find_next("span", class_="post-date")
+    return title.string, author.string, date.string
+
+
 def remove_st_nd_rd_th_from_date(string):
     """Function to transform 1st/2nd/3rd/4th in a parsable date format."""
     # Hackish way to convert string with numeral "1st"/"2nd"/etc to date
@@ -7150,10 +7234,78 @@ def remove_st_nd_rd_th_from_date(string):
     )
 
 
+ENGLISH_MONTHS = {
+    "january": 1,
+    "february": 2,
+    "march": 3,
+    "april": 4,
+    "may": 5,
+    "june": 6,
+    "july": 7,
+    "august": 8,
+    "september": 9,
+    "october": 10,
+    "november": 11,
+    "december": 12,
+}
+
+
+MONTH_DAY_YEAR_RE = re.compile(r"([A-Z][a-z]+) ([0-9]{1,2}), ([0-9]{4})")
+
+
+def month_day_year_to_date(string):
+    """Function to convert string like "January 27, 2019" to date object.
+
+    Raises ValueError (or KeyError) for strings not strictly in this form."""
+    match = MONTH_DAY_YEAR_RE.fullmatch(string)
+    if match is None:
+        raise ValueError("'%s' does not match format '%%B %%d, %%Y'" % string)
+    month, day, year = match.groups()
+    return date(int(year), ENGLISH_MONTHS[month.lower()], int(day))
+
+
+YEAR_MONTH_DAY_RE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})")
+
+
+def year_month_day_to_date(string):
+    """Function to convert string like "2019-01-27" to date object.
+
+    Raises ValueError for strings not strictly in this form."""
+    match = YEAR_MONTH_DAY_RE.fullmatch(string)
+    if match is None:
+        raise ValueError("'%s' does not match format '%%Y-%%m-%%d'" % string)
+    return date(*(int(g) for g in match.groups()))
+
+
+# Formats (for the default locale) which can be parsed without strptime
+FAST_DATE_PARSERS = {
+    "%B %d, %Y": month_day_year_to_date,
+    "%Y-%m-%d": year_month_day_to_date,
+}
+
+
 def string_to_date(string, date_format, local=DEFAULT_LOCAL):
     """Function to convert string to date object.
     Wrapper around datetime.datetime.strptime."""
+    # Strings from soups (NavigableString) keep the whole document alive:
+    # only plain str are used as cache keys
+    return _string_to_date(str(string), date_format, local)
+
+
+@functools.lru_cache(maxsize=4096)
+def _string_to_date(string, date_format, local):
+    """Implementation of string_to_date for plain str.
+
+    Results are cached as strptime (and changing the locale) is slow and
+    the same strings tend to be parsed multiple times. Common formats are
+    handled without strptime when possible."""
     # format described in https://docs.python.org/3.8/library/datetime.html#strftime-and-strptime-behavior
+    fast_parser = FAST_DATE_PARSERS.get(date_format)
+    if fast_parser is not None and local == DEFAULT_LOCAL:
+        try:
+            return fast_parser(string)
+        except (ValueError, KeyError):
+            pass  # Let strptime handle (or reject) unusual strings
     prev_locale = locale.setlocale(locale.LC_ALL)
     if local != prev_locale:
         locale.setlocale(locale.LC_ALL, local)
@@ -7164,9 +7316,15 @@ def string_to_date(string, date_format, local=DEFAULT_LOCAL):
 
 
 def isoformat_to_date(string):
-    """Fonction to convert string in isoformat to date object."""
+    """Fonction to convert string in isoformat to date object.
+
+    Only the date part at the beginning of the string is used so strptime
+    (and its locale handling) is not needed."""
     # 2019-08-17T14:25:35+00:00
-    return string_to_date(string[:10], "%Y-%m-%d")
+    match = YEAR_MONTH_DAY_RE.match(string)
+    if match is None:
+        raise ValueError("'%s' does not start with an isoformat date" % string)
+    return date(*(int(g) for g in match.groups()))
 
 
 def dict_to_date(d):
@@ -2,22 +2,48 @@
 # vim: set expandtab tabstop=4 shiftwidth=4 :
 """Module with functions wrapping urllib"""
 
+import concurrent.futures
+import email.parser
+import functools
+import hashlib
 import http.client
+import io
+import os
+import re
 import urllib.request
+import urllib.response
 import urllib.parse
+import socket
 import ssl
+import sys
 import json
 import shutil
 import gzip
+import threading
 
 try:
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, SoupStrainer
 except ImportError:
-    BeautifulSoup = None
+    BeautifulSoup = SoupStrainer = None
+try:
+    import lxml
+except ImportError:
+    lxml = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
 import inspect
 import logging
 import time
 
+# Parser used to build BeautifulSoup objects: lxml is much faster than the
+# parser from the standard library but is not always available.
+HTML_PARSER = "html.parser" if lxml is None else "lxml"
+# Parser used for XML documents (feeds, APIs): BeautifulSoup can only parse
+# XML with lxml - otherwise, the HTML parser does a reasonable job.
+XML_PARSER = HTML_PARSER if lxml is None else "lxml-xml"
+
 
 def log(string):
     """Dirty logging function."""
@@ -37,23 +63,380 @@ def convert_iri_to_plain_ascii_uri(uri):
     return url
 
 
-def urlopen_wrapper(url, referer=None):
+@functools.lru_cache(maxsize=1024)
+def getaddrinfo_cached(host, port):
+    """Wrapper around socket.getaddrinfo caching the most recent results.
+
+    Failures are not cached."""
+    return socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+
+
+def create_connection_cached_dns(
+    address, timeout=socket._GLOBAL_DEFAULT_TIMEOUT, source_address=None
+):
+    """Equivalent to socket.create_connection relying on getaddrinfo_cached."""
+    host, port = address
+    error = None
+    for _, _, _, _, sockaddr in getaddrinfo_cached(host, port):
+        try:
+            return socket.create_connection(sockaddr[:2], timeout, source_address)
+        except OSError as e:
+            error = e
+    raise error if error is not None else OSError("No address for %s" % host)
+
+
+def resolve_hosts(urls):
+    """Resolve the hosts of multiple urls concurrently to fill the DNS cache.
+
+    Failures are ignored: they will be reported when urls are retrieved."""
+    default_ports = {"http": http.client.HTTP_PORT, "https": http.client.HTTPS_PORT}
+    hosts = set()
+    for url in urls:
+        parts = urllib.parse.urlsplit(url)
+        if parts.hostname and parts.scheme in default_ports:
+            hosts.add((parts.hostname, parts.port or default_ports[parts.scheme]))
+
+    def resolve(host_port):
+        try:
+            getaddrinfo_cached(*host_port)
+        except OSError as e:
+            log("(host : %s) %s" % (host_port[0], e))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(resolve, hosts))
+
+
+# Minimal delay (in seconds) between the beginnings of two requests to the
+# same host: pages can be retrieved concurrently but servers must not get
+# bursts of requests.
+REQUEST_DELAY = 0.4
+NEXT_REQUEST_TIMES = {}
+NEXT_REQUEST_LOCK = threading.Lock()
+
+
+def wait_before_request(url):
+    """Wait until a request to the host of url can be performed (see
+    REQUEST_DELAY). This is thread-safe: concurrent requests to a host are
+    spaced out."""
+    host = urllib.parse.urlsplit(url).netloc
+    with NEXT_REQUEST_LOCK:
+        now = time.monotonic()
+        request_time = max(now, NEXT_REQUEST_TIMES.get(host, now))
+        NEXT_REQUEST_TIMES[host] = request_time + REQUEST_DELAY
+    time.sleep(request_time - now)
+
+
+class KeepAliveMixin(object):
+    """Mixin for urllib HTTP(S) handlers to reuse connections to a given host
+    (HTTP keep-alive) instead of opening a new one for every request.
+
+    Response bodies are read eagerly so that the connection can be given
+    back to the pool straight away: this is fine for the pages and images
+    we retrieve."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._connections = {}
+
+    def do_open(self, http_class, req, **http_conn_args):
+        """Implementation of AbstractHTTPHandler.do_open reusing connections."""
+        host = req.host
+        if not host:
+            raise urllib.error.URLError("no host given")
+        # Waiting here (instead of before opening the url) means documents
+        # served by the cache (see CacheHandler) are not delayed
+        wait_before_request(req.get_full_url())
+        if req._tunnel_host:
+            return super().do_open(http_class, req, **http_conn_args)
+        key = (http_class, host)
+        try:
+            conn = self._connections.setdefault(key, []).pop()
+            reused = True
+        except IndexError:
+            conn = http_class(host, timeout=req.timeout, **http_conn_args)
+            conn._create_connection = create_connection_cached_dns
+            reused = False
+        headers = dict(req.unredirected_hdrs)
+        headers.update((k, v) for k, v in req.headers.items() if k not in headers)
+        headers = {name.title(): val for name, val in headers.items()}
+        request_kwargs = {}
+        if sys.version_info >= (3, 6):  # Parameter not available before
+            request_kwargs["encode_chunked"] = req.has_header("Transfer-encoding")
+        try:
+            try:
+                conn.request(
+                    req.get_method(), req.selector, req.data, headers, **request_kwargs
+                )
+            except OSError as err:
+                raise urllib.error.URLError(err)
+            response = conn.getresponse()
+            try:
+                data = response.read()
+            except http.client.IncompleteRead as e:
+                if response.getheader("Content-Encoding") != "gzip":
+                    raise
+                # Partial data would be compressed garbage: handled as a
+                # network failure (and thus retried) instead
+                raise urllib.error.URLError("truncated gzip response: %r" % e)
+        except (
+            urllib.error.URLError,
+            http.client.RemoteDisconnected,
+            ConnectionResetError,
+            BrokenPipeError,
+        ):
+            conn.close()
+            if reused:
+                # Idle connection was probably closed by the server
+                return self.do_open(http_class, req, **http_conn_args)
+            raise
+        except Exception:
+            conn.close()
+            raise
+        self._connections[key].append(conn)
+        ret = urllib.response.addinfourl(
+            io.BytesIO(data), response.msg, req.get_full_url(), response.status
+        )
+        ret.msg = response.reason
+        return ret
+
+
+class KeepAliveHTTPHandler(KeepAliveMixin, urllib.request.HTTPHandler):
+    """HTTP handler with connection reuse."""
+
+
+class KeepAliveHTTPSHandler(KeepAliveMixin, urllib.request.HTTPSHandler):
+    """HTTPS handler with connection reuse."""
+
+
+MAX_AGE_RE = re.compile(r"max-age=([0-9]+)")
+# Headers of a 304 response which do not apply to the cached body
+BODY_HEADERS = {
+    "connection",
+    "content-encoding",
+    "content-length",
+    "content-type",
+    "keep-alive",
+    "transfer-encoding",
+}
+
+
+class CacheHandler(urllib.request.BaseHandler):
+    """Handler storing documents (pages, feeds, etc) on the file system.
+
+    Cached documents are revalidated using the ETag/Last-Modified headers
+    so that unchanged documents do not need to be downloaded again: the
+    server just answers with a "304 Not Modified". Documents which are
+    still fresh according to their "Cache-Control: max-age" are used
+    without performing any request."""
+
+    # Process responses before HTTPErrorProcessor considers 304 as an error
+    handler_order = 900
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _get_path(self, url):
+        """Get path to the cached body - metadata are in the .json file."""
+        return os.path.join(self.cache_dir, hashlib.sha1(url.encode()).hexdigest())
+
+    def _load(self, url):
+        """Load cached headers (as a HTTPMessage), body and time of storage for url."""
+        path = self._get_path(url)
+        try:
+            with open(path + ".json") as f:
+                metadata = json.load(f)
+            headers, saved_time = metadata["headers"], metadata.get("time", 0)
+            with open(path, "rb") as f:
+                data = f.read()
+        except (IOError, ValueError, KeyError):
+            return None, None, None
+        parser = email.parser.Parser(_class=http.client.HTTPMessage)
+        return parser.parsestr(headers, headersonly=True), data, saved_time
+
+    def _save(self, url, headers, data):
+        """Save headers (as a string) and body for url."""
+        path = self._get_path(url)
+        metadata = {"url": url, "headers": headers, "time": time.time()}
+        for file_path, mode, content in [
+            (path, "wb", data),
+            (path + ".json", "w", json.dumps(metadata)),
+        ]:
+            # Unique per thread: the same url can be saved concurrently
+            tmp_path = "%s.%d.%d.tmp" % (file_path, os.getpid(), threading.get_ident())
+            with open(tmp_path, mode) as f:
+                f.write(content)
+            os.replace(tmp_path, file_path)
+
+    @staticmethod
+    def _is_cacheable(headers):
+        """Check whether a response can (and should) be cached."""
+        if "no-store" in headers.get("Cache-Control", ""):
+            return False
+        if "ETag" not in headers and "Last-Modified" not in headers:
+            return False
+        subtype = headers.get_content_subtype()
+        return headers.get_content_maintype() == "text" or subtype.endswith(
+            ("json", "xml")
+        )
+
+    @staticmethod
+    def _is_fresh(headers, saved_time):
+        """Check whether a cached document can be used without revalidation."""
+        cache_control = headers.get("Cache-Control", "")
+        if "no-cache" in cache_control:
+            return False
+        max_age = MAX_AGE_RE.search(cache_control)
+        if max_age is None:
+            return False
+        return time.time() < saved_time + int(max_age.group(1))
+
+    @staticmethod
+    def _update_headers(headers, new_headers):
+        """Update cached headers with the ones of a 304 response (validators,
+        Cache-Control, etc) - except those describing the body sent."""
+        updated = set(BODY_HEADERS)
+        for name in new_headers.keys():
+            if name.lower() not in updated:
+                updated.add(name.lower())
+                del headers[name]
+                for value in new_headers.get_all(name):
+                    headers[name] = value
+
+    def default_open(self, req):
+        """Return the cached version without any request if it is still fresh."""
+        if req.get_method() != "GET" or req.type not in ("http", "https"):
+            return None
+        url = req.get_full_url()
+        headers, data, saved_time = self._load(url)
+        if headers is None or not self._is_fresh(headers, saved_time):
+            return None
+        log("(url : %s) still fresh - using cache" % url)
+        ret = urllib.response.addinfourl(io.BytesIO(data), headers, url, http.client.OK)
+        ret.msg = "OK"
+        ret.from_cache = True
+        return ret
+
+    def http_request(self, req):
+        """Add validators from the cached version to the request."""
+        if req.get_method() != "GET":
+            return req
+        headers, _, _ = self._load(req.get_full_url())
+        if headers is not None:
+            etag, last_modified = headers.get("ETag"), headers.get("Last-Modified")
+            if etag:
+                req.add_unredirected_header("If-None-Match", etag)
+            if last_modified:
+                req.add_unredirected_header("If-Modified-Since", last_modified)
+        return req
+
+    def http_response(self, req, response):
+        """Return the cached version if it is still valid or cache response."""
+        url = req.get_full_url()
+        code = response.getcode()
+        if getattr(response, "from_cache", False) or req.get_method() != "GET":
+            return response
+        if code == http.client.NOT_MODIFIED:
+            headers, data, _ = self._load(url)
+            if headers is not None:
+                log("(url : %s) not modified - using cache" % url)
+                # Document is fresh again (and may have new validators)
+                self._update_headers(headers, response.info())
+                self._save(url, str(headers), data)
+                ret = urllib.response.addinfourl(
+                    io.BytesIO(data), headers, url, http.client.OK
+                )
+                ret.msg = "OK"
+                return ret
+        elif code == http.client.OK and self._is_cacheable(response.info()):
+            data = response.read()
+            self._save(url, str(response.info()), data)
+            ret = urllib.response.addinfourl(
+                io.BytesIO(data), response.info(), url, code
+            )
+            ret.msg = response.msg
+            return ret
+        return response
+
+    https_request = http_request
+    https_response = http_response
+
+
+# Opener shared by all requests so that connections can be reused
+URL_OPENER = urllib.request.build_opener(KeepAliveHTTPHandler, KeepAliveHTTPSHandler)
+
+
+def enable_http_cache(cache_dir):
+    """Cache documents retrieved in the cache_dir folder (see CacheHandler).
+
+    Calling it again (in a forked worker process for instance) has no effect."""
+    if not any(isinstance(h, CacheHandler) for h in URL_OPENER.handlers):
+        URL_OPENER.add_handler(CacheHandler(cache_dir))
+
+
+# Transient errors (server overloaded, connection dropped) are retried a few
+# times, waiting RETRY_BACKOFF * 2^attempt seconds in between.
+NB_RETRIES = 3
+RETRY_BACKOFF = 0.3
+RETRY_HTTP_CODES = (500, 502, 503, 504)
+# Timeout (in seconds) for blocking operations on connections so that an
+# unresponsive server does not hang the whole process
+REQUEST_TIMEOUT = 30
+
+
+def open_with_retries(req):
+    """Open request with URL_OPENER, retrying on transient errors."""
+    for attempt in range(NB_RETRIES + 1):
+        try:
+            return URL_OPENER.open(req, timeout=REQUEST_TIMEOUT)
+        except urllib.error.HTTPError as e:
+            if attempt == NB_RETRIES or e.code not in RETRY_HTTP_CODES:
+                raise
+        except (
+            urllib.error.URLError,
+            http.client.RemoteDisconnected,
+            ConnectionResetError,
+            socket.timeout,
+        ) as e:
+            if attempt == NB_RETRIES or isinstance(
+                getattr(e, "reason", None), ssl.CertificateError
+            ):
+                raise
+        log("retrying %s" % req.full_url)
+        time.sleep(RETRY_BACKOFF * (1 << attempt))
+
+
+def urlopen_wrapper(url, referer=None, method=None):
     """Wrapper around urllib.request.urlopen (user-agent, etc).
 
     url is a string
     referer is an optional string
+    method is an optional HTTP method (GET by default)
     Returns a byte object."""
     log("(url : %s)" % url)
     user_agent = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/534.30 (KHTML, like Gecko) Ubuntu/11.04 Chromium/12.0.742.112 Chrome/12.0.742.112 Safari/534.30"
     try:
         req = urllib.request.Request(
-            url, headers={"User-Agent": user_agent, "Accept": "*/*"}
+            url,
+            headers={
+                "User-Agent": user_agent,
+                "Accept": "*/*",
+                "Accept-Encoding": "gzip",
+            },
+            method=method,
         )
         if referer:
             req.add_header("Referer", referer)
-        response = urllib.request.urlopen(req)
-        if response.info().get("Content-Encoding") == "gzip":
-            return gzip.GzipFile(fileobj=response)
+        response = open_with_retries(req)
+        # Responses to HEAD requests have no body to decompress
+        if method != "HEAD" and response.info().get("Content-Encoding") == "gzip":
+            # Headers are still needed by callers (content type, etc)
+            return urllib.response.addinfourl(
+                gzip.GzipFile(fileobj=response),
+                response.info(),
+                response.geturl(),
+                response.getcode(),
+            )
         return response
     except (
         urllib.error.HTTPError,
@@ -70,7 +453,23 @@ def urlopen_wrapper(url, referer=None):
 def urljoin_wrapper(base, url):
     """Wrapper around urllib.parse.urljoin.
     Construct a full ("absolute") URL by combining a "base URL" (base) with
-    another URL (url)."""
+    another URL (url).
+
+    Most URLs found in pages (images especially) are already absolute and
+    are returned as they are. Other results are cached as the same links
+    tend to be resolved multiple times (navigation links, etc)."""
+    if (
+        url.startswith(("http://", "https://"))
+        and "/." not in url
+        and not url.endswith(("?", "#"))
+    ):
+        return url
+    return urljoin_cached(base, url)
+
+
+@functools.lru_cache(maxsize=1024)
+def urljoin_cached(base, url):
+    """Cached version of urllib.parse.urljoin."""
     return urllib.parse.urljoin(base, url)
 
 
@@ -87,6 +486,22 @@ def get_content(url):
         return e.partial
 
 
+def get_headers_at_url(url):
+    """Get headers at url without retrieving the content (HEAD request).
+
+    Servers not supporting HEAD requests get a usual GET request.
+    Raises urllib.error.HTTPError like get_content if url is not valid."""
+    log("(url : %s)" % url)
+    try:
+        with urlopen_wrapper(url, method="HEAD") as response:
+            return response.info()
+    except urllib.error.HTTPError as e:
+        if e.code not in (405, 501):
+            raise
+    with urlopen_wrapper(url) as response:
+        return response.info()
+
+
 def extensions_are_equivalent(ext1, ext2):
     """Return whether file extensions can be considered as equivalent."""
     synonyms = [{"jpg", "jpeg"}]
@@ -125,7 +540,6 @@ def get_file_at_url(url, path, referer=None):
                 path = add_extension_to_filename_if_needed(data[0], path)
             with open(path, "wb") as out_file:
                 shutil.copyfileobj(response, out_file)
-                time.sleep(0.4)
                 return path
     except (
         urllib.error.HTTPError,
@@ -145,12 +559,40 @@ def get_filename_from_url(url):
 
 
 def load_json_at_url(url):
-    """Get content at url as JSON and return it."""
-    return json.loads(get_content(url).decode())
+    """Get content at url as JSON and return it.
+
+    orjson is used when available as it is much faster than json."""
+    content = get_content(url)
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content.decode())
+
+
+@functools.lru_cache(maxsize=32)
+def get_cached_soup_at_url(url):
+    """Get content at url as BeautifulSoup, caching the most recent pages.
+
+    The same page can be needed multiple times in a run (to find the first
+    comic, to start navigating from the last comic retrieved, etc): it is
+    then neither downloaded nor parsed again. Soup objects returned are
+    shared and must not be modified."""
+    return BeautifulSoup(get_content(url), HTML_PARSER)
+
+
+def get_xml_soup_at_url(url, parse_only=None):
+    """Get XML content at url as BeautifulSoup.
+
+    parse_only is an optional SoupStrainer (see get_soup_at_url)."""
+    return BeautifulSoup(get_content(url), XML_PARSER, parse_only=parse_only)
 
 
 def get_soup_at_url(
-    url, detect_meta=False, detect_rel=False, detect_angular=False, save_in_file=False
+    url,
+    detect_meta=False,
+    detect_rel=False,
+    detect_angular=False,
+    save_in_file=False,
+    parse_only=None,
 ):
     """Get content at url as BeautifulSoup.
 
@@ -161,10 +603,15 @@ def get_soup_at_url(
     detect_rel is a hacky flag to detect if page corresponds to an Angular app
     save_in_file is a hacky flag to save content in temp file for debugging
         purposes
-    Returns a BeautifulSoup object."""
-    time.sleep(0.4)
+    parse_only is an optional SoupStrainer to build only the relevant parts
+        of the document (much faster when only a few elements are needed)
+    Returns a BeautifulSoup object - full pages come from get_cached_soup_at_url."""
+    if parse_only is None and not (
+        detect_meta or detect_rel or detect_angular or save_in_file
+    ):
+        return get_cached_soup_at_url(url)
     content = get_content(url)
-    soup = BeautifulSoup(content, "html.parser")
+    soup = BeautifulSoup(content, HTML_PARSER, parse_only=parse_only)
     if detect_meta:
         for meta_val in ["generator", "ComicPress", "Comic-Easel"]:
             meta = soup.find("meta", attrs={"name": meta_val})